@@ -11,125 +11,676 @@ Author: Marvelous Olabinjo
 GitHub: https://github.com/MarvelOlas/aws-health-checker
 """
 
-import boto3
+import asyncio
+import functools
+import hashlib
+import os
+import sys
+import threading
+import time
 import json
 import argparse
-from datetime import datetime
-from botocore.exceptions import ClientError, NoCredentialsError
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from operator import itemgetter
 
+# boto3, botocore and aioboto3 are imported inside the functions that use
+# them, so --help and argument errors don't pay their import time
 
-def check_ec2_instances(region):
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Creating clients from a shared session is not thread-safe
+_client_lock = threading.Lock()
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'aws-health-checker')
+
+SEPARATOR = '=' * 50
+
+# Status indicators and message prefixes for display - plain ASCII when
+# output is piped or redirected, e.g. into log files (sys.stdout may also
+# be None, e.g. under pythonw)
+if getattr(sys.stdout, 'isatty', lambda: False)():
+    EC2_STATUS_ICONS = {
+        'running': '✅',
+        'stopped': '🛑',
+        'pending': '⏳',
+        'stopping': '⏳',
+        'terminated': '💀'
+    }
+    EC2_UNKNOWN_ICON = '⚠️'
+    ALARM_STATUS_ICONS = {
+        'OK': '✅',
+        'ALARM': '🚨',
+        'INSUFFICIENT_DATA': '⚠️'
+    }
+    ALARM_UNKNOWN_ICON = '❓'
+    SYMBOLS = {
+        'error': '❌ ',
+        'info': 'ℹ️  ',
+        'warning': '⚠️  ',
+        'ok': '✅ ',
+        'stats': '📊 ',
+        'title': '🔍 ',
+        'time': '📅 ',
+        'region': '🌍 ',
+        'account': '👤 ',
+        'report': '📄 '
+    }
+else:
+    EC2_STATUS_ICONS = {
+        'running': '[OK]',
+        'stopped': '[STOP]',
+        'pending': '[WAIT]',
+        'stopping': '[WAIT]',
+        'terminated': '[TERM]'
+    }
+    EC2_UNKNOWN_ICON = '[WARN]'
+    ALARM_STATUS_ICONS = {
+        'OK': '[OK]',
+        'ALARM': '[ALARM]',
+        'INSUFFICIENT_DATA': '[NODATA]'
+    }
+    ALARM_UNKNOWN_ICON = '[?]'
+    SYMBOLS = {
+        'error': '[ERROR] ',
+        'info': '[INFO] ',
+        'warning': '[WARN] ',
+        'ok': '[OK] ',
+        'stats': '',
+        'title': '',
+        'time': '',
+        'region': '',
+        'account': '',
+        'report': ''
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def get_client_config():
+    """
+    Get the botocore Config shared by every client.
+    
+    Enough pooled connections for a multi-region run, bounded timeouts,
+    and adaptive retries. Adaptive mode adds client-side rate limiting on
+    top of backoff, so throttling errors such as RequestLimitExceeded are
+    retried instead of failing the check.
+    
+    Returns:
+        botocore.config.Config: Client configuration
+    """
+    from botocore.config import Config
+    
+    return Config(
+        retries={'mode': 'adaptive', 'max_attempts': 10},
+        max_pool_connections=50,
+        connect_timeout=5,
+        read_timeout=10
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_boto3_session():
+    """
+    Get the boto3 session shared by the whole process.
+    
+    Credentials and endpoint data are loaded once and reused by every
+    client.
+    
+    Returns:
+        boto3.Session: Shared session
+    """
+    import boto3
+    
+    return boto3.Session()
+
+
+def create_session():
+    """
+    Create the aioboto3 session shared by all clients in a health check run.
+    
+    Returns:
+        aioboto3.Session or None: None when aioboto3 is not installed and
+        the checks fall back to the shared boto3 session
+    """
+    try:
+        import aioboto3
+    except ImportError:
+        return None
+    return aioboto3.Session()
+
+
+@functools.lru_cache(maxsize=None)
+def _create_client(service, region):
+    return get_boto3_session().client(
+        service, region_name=region, config=get_client_config()
+    )
+
+
+def get_client(service, region):
+    """
+    Get the shared boto3 client for a service and region.
+    
+    Clients are created once and reused, so repeated calls share their
+    connection pool. Clients are thread-safe once created.
+    
+    Args:
+        service (str): AWS service name, e.g. 'ec2'
+        region (str): AWS region name
+    
+    Returns:
+        botocore.client.BaseClient: boto3 client
+    """
+    with _client_lock:
+        return _create_client(service, region)
+
+
+async def call_aws(session, service, region, operation, **kwargs):
     """
-    Check the status of all EC2 instances in a region.
+    Call a single-response AWS API operation without blocking the event
+    loop.
     
     Args:
+        session: Session returned by create_session()
+        service (str): AWS service name, e.g. 'sts'
         region (str): AWS region name
+        operation (str): Client method name, e.g. 'get_caller_identity'
+    
+    Returns:
+        dict: API response
+    """
+    if session is not None:
+        async with session.client(service, region_name=region,
+                                  config=get_client_config()) as client:
+            return await getattr(client, operation)(**kwargs)
+    
+    def blocking_call():
+        return getattr(get_client(service, region), operation)(**kwargs)
+    
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, blocking_call)
+
+
+async def paginate_aws(session, service, region, operation, page_size,
+                       **kwargs):
+    """
+    Stream the pages of a paginated AWS API operation without blocking
+    the event loop.
+    
+    Pages are yielded as they arrive, so callers can reduce each one to
+    the fields they need instead of holding every raw response at once.
+    With aioboto3 the pages are fetched natively; with plain boto3 each
+    page is fetched in the event loop's default thread pool executor.
+    
+    Args:
+        session: Session returned by create_session()
+        service (str): AWS service name, e.g. 'ec2'
+        region (str): AWS region name
+        operation (str): Client method name, e.g. 'describe_instances'
+        page_size (int): Items per page; use the API maximum to keep
+            round-trips to a minimum
+    
+    Yields:
+        dict: API response page
+    """
+    pagination_config = {'PageSize': page_size}
+    
+    if session is not None:
+        async with session.client(service, region_name=region,
+                                  config=get_client_config()) as client:
+            paginator = client.get_paginator(operation)
+            async for page in paginator.paginate(
+                PaginationConfig=pagination_config, **kwargs
+            ):
+                yield page
+        return
+    
+    # Building the client loads the service model and may wait on
+    # _client_lock, so keep it off the event loop as well
+    def start_pagination():
+        paginator = get_client(service, region).get_paginator(operation)
+        return iter(paginator.paginate(
+            PaginationConfig=pagination_config, **kwargs
+        ))
+    
+    loop = asyncio.get_running_loop()
+    pages = await loop.run_in_executor(None, start_pagination)
+    
+    # Page iteration is lazy: each next() call makes one API request
+    while True:
+        page = await loop.run_in_executor(None, next, pages, None)
+        if page is None:
+            return
+        yield page
+
+
+def cache_path(region, endpoint, params=None):
+    """
+    Get the cache file for one check.
+    
+    The key covers the access key of the resolved credentials, so
+    switching accounts by any means (profile, environment, SSO) never
+    reads another account's results. Resolving credentials can block,
+    so call this from the executor.
+    
+    Args:
+        region (str): AWS region name
+        endpoint (str): AWS service name, e.g. 'ec2'
+        params: Any request parameters that change the result
+    
+    Returns:
+        str: Path of the JSON cache file
+    """
+    credentials = get_boto3_session().get_credentials()
+    access_key = credentials.access_key if credentials is not None else None
+    key_source = json.dumps(
+        [access_key, region, endpoint, params],
+        sort_keys=True
+    )
+    key = hashlib.sha256(key_source.encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+def read_cache(path, ttl):
+    """
+    Load cached check results if they are younger than the TTL.
+    
+    Args:
+        path (str): Cache file from cache_path()
+        ttl (int): Maximum age in seconds (0 disables the cache)
+    
+    Returns:
+        list or None: Cached results, or None if missing or stale
+    """
+    if ttl <= 0:
+        return None
+    
+    try:
+        if time.time() - os.path.getmtime(path) > ttl:
+            return None
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_cache(path, results):
+    """
+    Store check results in the cache.
+    
+    Failures are ignored - the cache is only an optimisation.
+    
+    Args:
+        path (str): Cache file from cache_path()
+        results (list): Check results to store
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(results, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+async def load_cache(region, endpoint, params, cache_ttl, refresh_cache):
+    """
+    Look up cached results without blocking the event loop.
+    
+    Args:
+        region (str): AWS region name
+        endpoint (str): AWS service name, e.g. 'ec2'
+        params: Any request parameters that change the result
+        cache_ttl (int): Reuse results cached within this many seconds
+        refresh_cache (bool): Ignore cached results, but still update them
+    
+    Returns:
+        tuple: (path, cached) where path is None when caching is off and
+        cached is None on a cache miss
+    """
+    if cache_ttl <= 0:
+        return None, None
+    
+    def lookup():
+        path = cache_path(region, endpoint, params)
+        if refresh_cache:
+            return path, None
+        return path, read_cache(path, cache_ttl)
+    
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, lookup)
+
+
+async def save_cache(path, results):
+    """
+    Store results in the cache without blocking the event loop.
+    
+    Args:
+        path (str): Cache file from load_cache(), or None if caching is off
+        results: Results to store
+    """
+    if path is None:
+        return
+    
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, write_cache, path, results)
+
+
+async def get_account_id(region, session, cache_ttl=0, refresh_cache=False):
+    """
+    Look up the AWS account the credentials belong to.
+    
+    The account ID is cached alongside the check results, so runs served
+    from the cache make no API calls at all.
+    
+    Args:
+        region (str): AWS region name for the STS endpoint
+        session: Session returned by create_session()
+        cache_ttl (int): Reuse an account ID cached within this many seconds
+        refresh_cache (bool): Ignore the cached ID, but still update it
     
     Returns:
-        list: List of instance dictionaries with id, type, state, name
+        str or None: Account ID, or None if it could not be determined
     """
-    print(f"\n{'='*50}")
-    print("EC2 INSTANCE STATUS")
-    print(f"{'='*50}")
+    from botocore.exceptions import ClientError
+    
+    # STS identity does not depend on the region, so neither does the key
+    path, cached = await load_cache(None, 'sts', None, cache_ttl, refresh_cache)
+    if cached is not None:
+        return cached
     
     try:
-        ec2 = boto3.client('ec2', region_name=region)
-        response = ec2.describe_instances()
-    except NoCredentialsError:
-        print("❌ Error: AWS credentials not configured")
+        identity = await call_aws(session, 'sts', region, 'get_caller_identity')
+    except ClientError:
+        return None
+    
+    await save_cache(path, identity['Account'])
+    return identity['Account']
+
+
+def print_aws_error(error):
+    """
+    Display an error raised by one of the health checks.
+    
+    Args:
+        error (Exception): Exception returned by asyncio.gather
+    
+    Raises:
+        Exception: Re-raises anything that is not an AWS client or
+        botocore error
+    """
+    from botocore.exceptions import (
+        BotoCoreError, ClientError, NoCredentialsError
+    )
+    
+    if isinstance(error, NoCredentialsError):
+        print(f"{SYMBOLS['error']}Error: AWS credentials not configured")
         print("   Run 'aws configure' to set up credentials")
-        return []
-    except ClientError as e:
-        print(f"❌ Error: {e.response['Error']['Message']}")
-        return []
+    elif isinstance(error, ClientError):
+        print(f"{SYMBOLS['error']}Error: {error.response['Error']['Message']}")
+    elif isinstance(error, BotoCoreError):
+        # Connection failures, timeouts etc. - report under this region's
+        # header and carry on with the others
+        print(f"{SYMBOLS['error']}Error: {error}")
+    else:
+        raise error
+
+
+def get_known_regions():
+    """
+    Get every EC2 region botocore knows about, across all partitions.
     
-    instances = []
+    Returns:
+        set: Region names, e.g. {'us-east-1', 'cn-north-1', ...}
+    """
+    session = get_boto3_session()
+    return {
+        region
+        for partition in session.get_available_partitions()
+        for region in session.get_available_regions('ec2', partition)
+    }
+
+
+def build_instance_filters(states=None, name_prefix=None):
+    """
+    Build server-side filters for describe_instances.
+    
+    Filtering on the AWS side means instances we would ignore are never
+    sent, parsed or turned into Python objects.
+    
+    Args:
+        states (list): Instance states to keep, e.g. ['running']
+        name_prefix (str): Only keep instances whose Name tag starts
+            with this prefix
+    
+    Returns:
+        list: describe_instances Filters (empty to match everything)
+    """
+    filters = []
+    if states:
+        filters.append({'Name': 'instance-state-name', 'Values': states})
+    if name_prefix:
+        filters.append({'Name': 'tag:Name', 'Values': [f"{name_prefix}*"]})
+    return filters
+
+
+async def check_ec2_instances(region, session, filters=None, cache_ttl=0,
+                              refresh_cache=False):
+    """
+    Fetch the status of all EC2 instances in a region.
+    
+    Args:
+        region (str): AWS region name
+        session: Session returned by create_session()
+        filters (list): Optional describe_instances Filters
+        cache_ttl (int): Reuse results cached within this many seconds
+        refresh_cache (bool): Ignore cached results, but still update them
     
-    for reservation in response['Reservations']:
-        for instance in reservation['Instances']:
-            instance_info = {
+    Returns:
+        list: List of instance dictionaries with id, type, state, name, region
+    """
+    path, cached = await load_cache(
+        region, 'ec2', filters, cache_ttl, refresh_cache
+    )
+    if cached is not None:
+        return cached
+    
+    kwargs = {'Filters': filters} if filters else {}
+    pages = paginate_aws(
+        session, 'ec2', region, 'describe_instances', page_size=1000,
+        **kwargs
+    )
+    
+    # Keep only the fields we report; each raw page is dropped once parsed
+    instances = []
+    async for page in pages:
+        instances.extend([
+            {
                 'instance_id': instance['InstanceId'],
                 'instance_type': instance['InstanceType'],
                 'state': instance['State']['Name'],
-                'name': 'Unnamed'
+                # Name tag if exists
+                'name': next(
+                    (t['Value'] for t in instance.get('Tags') or ()
+                     if t['Key'] == 'Name'),
+                    'Unnamed'
+                ),
+                'region': region
             }
-            
-            # Get Name tag if exists
-            for tag in instance.get('Tags', []):
-                if tag['Key'] == 'Name':
-                    instance_info['name'] = tag['Value']
-                    break
-            
-            instances.append(instance_info)
-            
-            # Display with status indicator
-            status_icons = {
-                'running': '✅',
-                'stopped': '🛑',
-                'pending': '⏳',
-                'stopping': '⏳',
-                'terminated': '💀'
-            }
-            status = status_icons.get(instance_info['state'], '⚠️')
-            
-            print(f"{status} {instance_info['name']} ({instance_info['instance_id']})")
-            print(f"   Type: {instance_info['instance_type']}, State: {instance_info['state']}")
+            for reservation in page['Reservations']
+            for instance in reservation['Instances']
+        ])
     
-    if not instances:
-        print("ℹ️  No EC2 instances found in this region.")
+    await save_cache(path, instances)
     
     return instances
 
 
-def check_cloudwatch_alarms(region):
+def display_ec2_instances(result, region=None):
     """
-    Check the status of all CloudWatch alarms in a region.
+    Display the EC2 instance status returned by check_ec2_instances.
     
     Args:
-        region (str): AWS region name
+        result (list or Exception): Instance list, or the error raised
+            while fetching it
+        region (str): Region to show in the header (multi-region runs)
     
     Returns:
-        list: List of alarm dictionaries with name, state, metric
+        list: List of instance dictionaries (empty on error)
     """
-    print(f"\n{'='*50}")
-    print("CLOUDWATCH ALARM STATUS")
-    print(f"{'='*50}")
+    print("\n" + SEPARATOR)
+    print(f"EC2 INSTANCE STATUS - {region}" if region else "EC2 INSTANCE STATUS")
+    print(SEPARATOR)
     
-    try:
-        cloudwatch = boto3.client('cloudwatch', region_name=region)
-        response = cloudwatch.describe_alarms()
-    except NoCredentialsError:
-        print("❌ Error: AWS credentials not configured")
-        return []
-    except ClientError as e:
-        print(f"❌ Error: {e.response['Error']['Message']}")
+    if isinstance(result, BaseException):
+        print_aws_error(result)
         return []
     
+    # Build every row first and write them out in one call
+    out = []
+    for instance_info in result:
+        # Display with status indicator
+        state = instance_info['state']
+        status = EC2_STATUS_ICONS.get(state, EC2_UNKNOWN_ICON)
+        
+        out.append(f"{status} {instance_info['name']} ({instance_info['instance_id']})")
+        out.append(f"   Type: {instance_info['instance_type']}, State: {state}")
+    
+    if out:
+        sys.stdout.write("\n".join(out))
+        sys.stdout.write("\n")
+    else:
+        print(f"{SYMBOLS['info']}No EC2 instances found in this region.")
+    
+    return result
+
+
+async def check_cloudwatch_alarms(region, session, cache_ttl=0,
+                                  refresh_cache=False):
+    """
+    Fetch the status of all CloudWatch alarms in a region.
+    
+    Args:
+        region (str): AWS region name
+        session: Session returned by create_session()
+        cache_ttl (int): Reuse results cached within this many seconds
+        refresh_cache (bool): Ignore cached results, but still update them
+    
+    Returns:
+        list: List of alarm dictionaries with name, state, metric, region
+    """
+    path, cached = await load_cache(
+        region, 'cloudwatch', None, cache_ttl, refresh_cache
+    )
+    if cached is not None:
+        return cached
+    
+    pages = paginate_aws(
+        session, 'cloudwatch', region, 'describe_alarms', page_size=100
+    )
+    
+    # Keep only the fields we report; each raw page is dropped once parsed
     alarms = []
+    async for page in pages:
+        alarms.extend([
+            {
+                'name': alarm['AlarmName'],
+                'state': alarm['StateValue'],
+                'metric': alarm['MetricName'],
+                'description': alarm.get('AlarmDescription', 'No description'),
+                'region': region
+            }
+            for alarm in page['MetricAlarms']
+        ])
     
-    for alarm in response['MetricAlarms']:
-        alarm_info = {
-            'name': alarm['AlarmName'],
-            'state': alarm['StateValue'],
-            'metric': alarm['MetricName'],
-            'description': alarm.get('AlarmDescription', 'No description')
-        }
-        alarms.append(alarm_info)
-        
-        status_icons = {
-            'OK': '✅',
-            'ALARM': '🚨',
-            'INSUFFICIENT_DATA': '⚠️'
-        }
-        status = status_icons.get(alarm_info['state'], '❓')
+    await save_cache(path, alarms)
+    
+    return alarms
+
+
+def display_cloudwatch_alarms(result, region=None):
+    """
+    Display the CloudWatch alarm status returned by check_cloudwatch_alarms.
+    
+    Args:
+        result (list or Exception): Alarm list, or the error raised
+            while fetching it
+        region (str): Region to show in the header (multi-region runs)
+    
+    Returns:
+        list: List of alarm dictionaries (empty on error)
+    """
+    print("\n" + SEPARATOR)
+    print(f"CLOUDWATCH ALARM STATUS - {region}" if region else "CLOUDWATCH ALARM STATUS")
+    print(SEPARATOR)
+    
+    if isinstance(result, BaseException):
+        print_aws_error(result)
+        return []
+    
+    # Build every row first and write them out in one call
+    out = []
+    for alarm_info in result:
+        status = ALARM_STATUS_ICONS.get(alarm_info['state'], ALARM_UNKNOWN_ICON)
         
-        print(f"{status} {alarm_info['name']}")
-        print(f"   State: {alarm_info['state']}, Metric: {alarm_info['metric']}")
+        out.append(f"{status} {alarm_info['name']}")
+        out.append(f"   State: {alarm_info['state']}, Metric: {alarm_info['metric']}")
     
-    if not alarms:
-        print("ℹ️  No CloudWatch alarms configured in this region.")
+    if out:
+        sys.stdout.write("\n".join(out))
+        sys.stdout.write("\n")
+    else:
+        print(f"{SYMBOLS['info']}No CloudWatch alarms configured in this region.")
     
-    return alarms
+    return result
+
+
+async def run_health_checks(regions, instance_filters=None, cache_ttl=0,
+                            refresh_cache=False):
+    """
+    Run the EC2 and CloudWatch checks for every region concurrently.
+    
+    Args:
+        regions (list): AWS region names
+        instance_filters (list): Optional describe_instances Filters
+        cache_ttl (int): Reuse results cached within this many seconds
+        refresh_cache (bool): Ignore cached results, but still update them
+    
+    Returns:
+        tuple: (account_id, results) where account_id is the caller's AWS
+        account (or None) and results is a list of (region, instances,
+        alarms) tuples in input order; instances or alarms is the
+        exception raised by that check if it failed
+    """
+    # Two blocking calls per region, plus the account lookup, when
+    # aioboto3 is not installed
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=min(32, len(regions) * 2 + 1))
+    )
+    
+    session = create_session()
+    checks = [get_account_id(regions[0], session, cache_ttl, refresh_cache)]
+    for region in regions:
+        checks.append(check_ec2_instances(
+            region, session, instance_filters, cache_ttl, refresh_cache
+        ))
+        checks.append(check_cloudwatch_alarms(
+            region, session, cache_ttl, refresh_cache
+        ))
+    
+    account_id, *results = await asyncio.gather(*checks, return_exceptions=True)
+    if isinstance(account_id, BaseException):
+        account_id = None
+    
+    return account_id, [
+        (region, results[2 * i], results[2 * i + 1])
+        for i, region in enumerate(regions)
+    ]
 
 
 def generate_summary(instances, alarms):
@@ -143,45 +694,49 @@ def generate_summary(instances, alarms):
     Returns:
         dict: Summary statistics
     """
-    print(f"\n{'='*50}")
+    print("\n" + SEPARATOR)
     print("SUMMARY")
-    print(f"{'='*50}")
+    print(SEPARATOR)
     
-    # Calculate instance statistics
+    # Calculate instance statistics (one pass over the list, all in C:
+    # itemgetter pulls each 'state' and Counter tallies it)
+    get_state = itemgetter('state')
+    instance_states = Counter(map(get_state, instances))
     total_instances = len(instances)
-    running = sum(1 for i in instances if i['state'] == 'running')
-    stopped = sum(1 for i in instances if i['state'] == 'stopped')
+    running = instance_states['running']
+    stopped = instance_states['stopped']
     other = total_instances - running - stopped
     
-    # Calculate alarm statistics
+    # Calculate alarm statistics (one pass over the list)
+    alarm_states = Counter(map(get_state, alarms))
     total_alarms = len(alarms)
-    alarming = sum(1 for a in alarms if a['state'] == 'ALARM')
-    ok_alarms = sum(1 for a in alarms if a['state'] == 'OK')
+    alarming = alarm_states['ALARM']
+    ok_alarms = alarm_states['OK']
     
     # Display summary
-    print(f"\n📊 EC2 Instances:")
+    print(f"\n{SYMBOLS['stats']}EC2 Instances:")
     print(f"   Total: {total_instances}")
     print(f"   Running: {running}")
     print(f"   Stopped: {stopped}")
     if other > 0:
         print(f"   Other: {other}")
     
-    print(f"\n📊 CloudWatch Alarms:")
+    print(f"\n{SYMBOLS['stats']}CloudWatch Alarms:")
     print(f"   Total: {total_alarms}")
     print(f"   OK: {ok_alarms}")
     print(f"   In Alarm: {alarming}")
     
     # Overall health assessment
-    print(f"\n{'='*50}")
+    print("\n" + SEPARATOR)
     if alarming > 0:
-        print("⚠️  ATTENTION: There are active alarms that need investigation!")
+        print(f"{SYMBOLS['warning']}ATTENTION: There are active alarms that need investigation!")
     elif running == total_instances and total_instances > 0:
-        print("✅ ALL SYSTEMS HEALTHY")
+        print(f"{SYMBOLS['ok']}ALL SYSTEMS HEALTHY")
     elif total_instances == 0 and total_alarms == 0:
-        print("ℹ️  No resources found to monitor")
+        print(f"{SYMBOLS['info']}No resources found to monitor")
     else:
-        print("⚠️  Some instances are not running")
-    print(f"{'='*50}")
+        print(f"{SYMBOLS['warning']}Some instances are not running")
+    print(SEPARATOR)
     
     return {
         'total_instances': total_instances,
@@ -192,21 +747,43 @@ def generate_summary(instances, alarms):
     }
 
 
-def save_report(filename, region, instances, alarms, summary):
+def dump_json(data, pretty=False):
+    """
+    Serialize data to JSON bytes, using orjson when it is installed.
+    
+    Args:
+        data: JSON-serializable data
+        pretty (bool): Indent with two spaces instead of compact output
+    
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(
+        data,
+        indent=2 if pretty else None,
+        separators=None if pretty else (',', ':'),
+        ensure_ascii=False
+    ).encode()
+
+
+def save_report(filename, regions, instances, alarms, summary, pretty=False):
     """
     Save the health report to a JSON file.
     
     Args:
         filename (str): Output filename
-        region (str): AWS region
+        regions (list): AWS regions checked
         instances (list): Instance data
         alarms (list): Alarm data
         summary (dict): Summary statistics
+        pretty (bool): Indent the JSON for readability
     """
     report = {
         'report_metadata': {
-            'generated_at': datetime.now().isoformat(),
-            'region': region,
+            'generated_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'region': ','.join(regions),
             'tool': 'AWS Health Checker',
             'author': 'Marvelous Olabinjo'
         },
@@ -215,10 +792,10 @@ def save_report(filename, region, instances, alarms, summary):
         'summary': summary
     }
     
-    with open(filename, 'w') as f:
-        json.dump(report, f, indent=2)
+    with open(filename, 'wb') as f:
+        f.write(dump_json(report, pretty))
     
-    print(f"\n📄 Report saved to: {filename}")
+    print(f"\n{SYMBOLS['report']}Report saved to: {filename}")
 
 
 def main():
@@ -233,41 +810,99 @@ def main():
 Examples:
   python health_checker.py                    # Check eu-west-1 (default)
   python health_checker.py --region us-east-1 # Check specific region
+  python health_checker.py --region us-east-1,eu-west-1  # Check several regions
   python health_checker.py --output report.json  # Save to file
+  python health_checker.py --output report.json --pretty  # Indented JSON
+  python health_checker.py --states running,stopped --name-prefix web
+  python health_checker.py --cache-ttl 600  # Reuse results for 10 minutes
         """
     )
     parser.add_argument(
         '--region',
         default='eu-west-1',
-        help='AWS region to check (default: eu-west-1)'
+        help='AWS region(s) to check, comma-separated (default: eu-west-1)'
     )
     parser.add_argument(
         '--output',
         metavar='FILE',
         help='Save report to JSON file'
     )
+    parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help='Indent the JSON report (default: compact)'
+    )
+    parser.add_argument(
+        '--states',
+        help='Only check instances in these states, comma-separated '
+             '(e.g. running,stopped; default: all)'
+    )
+    parser.add_argument(
+        '--name-prefix',
+        metavar='PREFIX',
+        help='Only check instances whose Name tag starts with PREFIX'
+    )
+    parser.add_argument(
+        '--cache-ttl',
+        type=int,
+        default=0,
+        metavar='SECONDS',
+        help='Reuse results cached on disk within SECONDS (default: 0, off)'
+    )
+    parser.add_argument(
+        '--refresh-cache',
+        action='store_true',
+        help='Ignore cached results and fetch fresh data'
+    )
     
     args = parser.parse_args()
+    regions = [r.strip() for r in args.region.split(',') if r.strip()]
+    if not regions:
+        parser.error('--region must name at least one region')
+    unknown = [r for r in regions if r not in get_known_regions()]
+    if unknown:
+        parser.error(f"unknown region(s): {', '.join(unknown)}")
+    states = [s.strip() for s in (args.states or '').split(',') if s.strip()]
+    instance_filters = build_instance_filters(states, args.name_prefix)
+    
+    # Resolve credentials once so a missing setup fails fast
+    if get_boto3_session().get_credentials() is None:
+        print(f"{SYMBOLS['error']}Error: AWS credentials not configured")
+        print("   Run 'aws configure' to set up credentials")
+        sys.exit(2)
     
     # Display header
-    print("\n" + "=" * 50)
-    print("🔍 AWS HEALTH CHECKER")
-    print("=" * 50)
-    print(f"📅 Report Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"🌍 Region: {args.region}")
+    print("\n" + SEPARATOR)
+    print(f"{SYMBOLS['title']}AWS HEALTH CHECKER")
+    print(SEPARATOR)
+    print(f"{SYMBOLS['time']}Report Time: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"{SYMBOLS['region']}Region: {', '.join(regions)}")
+    
+    # Run health checks concurrently, then display results in order
+    account_id, results = asyncio.run(run_health_checks(
+        regions, instance_filters, args.cache_ttl, args.refresh_cache
+    ))
     
-    # Run health checks
-    instances = check_ec2_instances(args.region)
-    alarms = check_cloudwatch_alarms(args.region)
+    if account_id:
+        print(f"{SYMBOLS['account']}Account: {account_id}")
+    
+    instances = []
+    alarms = []
+    multi_region = len(regions) > 1
+    for region, instance_result, alarm_result in results:
+        label = region if multi_region else None
+        instances.extend(display_ec2_instances(instance_result, label))
+        alarms.extend(display_cloudwatch_alarms(alarm_result, label))
     
     # Generate summary
     summary = generate_summary(instances, alarms)
     
     # Save to file if requested
     if args.output:
-        save_report(args.output, args.region, instances, alarms, summary)
+        save_report(args.output, regions, instances, alarms, summary,
+                    args.pretty)
     
-    print("\n✅ Health check complete!\n")
+    print(f"\n{SYMBOLS['ok']}Health check complete!\n")
 
 
 if __name__ == "__main__":